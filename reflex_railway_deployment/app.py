@@ -32,6 +32,7 @@ clerk.install_pages(
     signup_route="/sign-up"
 )
 
-# External API
+# External API - routes must be registered at import, before Reflex mounts
+# app.api onto the api_transformer in App.__call__ (lifespan tasks run later)
 from .reflex_user_portal.backend.api import setup_api
-setup_api(app)
\ No newline at end of file
+setup_api(app)
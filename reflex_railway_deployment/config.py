@@ -1,51 +1,151 @@
 """Configuration settings for the application."""
-import os, warnings
-from dotenv import load_dotenv
-
-# Load environment variables
-load_envar = load_dotenv()
-if not load_envar:
-    warnings.warn("Failed to load environment variables from .env file.")
-
-# App configuration
-APP_DISPLAY_NAME = os.getenv("REFLEX_APP_NAME", "App Portal")
-REFLEX_ENV_MODE = os.getenv("APP_ENV", "DEV").upper()
-LOG_LEVEL = os.getenv("LOG_LEVEL", "DEBUG" if REFLEX_ENV_MODE.upper() in ["DEV", "TEST", "Env.DEV"] else "INFO").upper()
-print(f"App environment: {REFLEX_ENV_MODE}")
-
-# Admin configuration
-ADMIN_USER_EMAILS = os.getenv("ADMIN_USER_EMAILS", "").split(",")
-
-# Clerk configuration
-CLERK_PUBLISHABLE_KEY = os.getenv("CLERK_PUBLISHABLE_KEY")
-CLERK_SECRET_KEY = os.getenv("CLERK_SECRET_KEY")
-CLERK_AUTHORIZED_DOMAINS = os.getenv("CLERK_AUTHORIZED_DOMAINS", "localhost:3000,*").split(",")
-    # add railway frontend domain if needed
-CLERK_AUTHORIZED_DOMAINS += [os.getenv("FRONTEND_URL", "")]
-
-# Database configuration
-DB_PASSWORD = os.getenv("DB_PASSWORD")
-DB_CONN_URI = os.getenv("REFLEX_DB_URL", "").format(DB_PASSWORD=DB_PASSWORD) if DB_PASSWORD else os.getenv("REFLEX_DB_URL", "")
-DB_LOCAL_URI = os.getenv("REFLEX_DB_URL", "sqlite:///app.db")
-
-# if REFLEX_DB_URL not specified, use local database in development. Otherwise, stick to stick to REFLEX_DB_URL
-DATABASE_URL = DB_LOCAL_URI if REFLEX_ENV_MODE == "DEV" else DB_CONN_URI
-
-# API URL
-API_URL = os.getenv("REFLEX_API_URL", os.getenv("API_URL", "http://localhost:8000"))
-
-# Frontend URL - prioritize FRONTEND_DEPLOY_URL for backend services
-FRONTEND_URL = (
-    os.getenv("FRONTEND_DEPLOY_URL") or  # Railway deploy script sets this
-    os.getenv("RAILWAY_PUBLIC_DOMAIN") or  # Railway auto-generated domain
-    os.getenv("REFLEX_DEPLOY_URL") or  # Legacy fallback
-    os.getenv("DEPLOY_URL") or  # Legacy fallback
-    "http://localhost:3000"  # Development default
+import os, sys, warnings
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import FrozenSet, Mapping, Optional
+
+
+def _compiled_env() -> Optional[Mapping[str, str]]:
+    """Return the ENV compiled by scripts/compile_env.py, or None if it is missing or stale."""
+    try:
+        from . import _env_compiled
+    except ImportError:
+        return None
+    try:
+        stale = os.path.getmtime(_env_compiled.SOURCE) > os.path.getmtime(_env_compiled.__file__)
+    except (AttributeError, OSError):
+        stale = False  # source .env not available (e.g. on Railway): trust the compiled values
+    if stale:
+        warnings.warn(
+            f"{_env_compiled.SOURCE} is newer than {_env_compiled.__file__}; falling back to "
+            "load_dotenv(). Re-run scripts/compile_env.py to refresh it."
+        )
+        return None
+    return _env_compiled.ENV
+
+
+# Load environment variables, preferring the .env compiled by scripts/compile_env.py
+_COMPILED_ENV = _compiled_env()
+if _COMPILED_ENV is None:
+    from dotenv import load_dotenv
+    load_envar = load_dotenv()
+    if not load_envar:
+        warnings.warn("Failed to load environment variables from .env file.")
+else:
+    # Raw values (compile_env.py refuses ${VAR} expansion); the live environment wins
+    for _key, _value in _COMPILED_ENV.items():
+        os.environ.setdefault(_key, _value)
+
+# Snapshot of the environment, taken once after .env is loaded
+_ENV = os.environ.copy()
+
+# Modes that default to DEBUG logging
+_DEV_MODES = frozenset({"DEV", "TEST"})
+
+# Frontend URL sources, in priority order
+_FRONTEND_URL_KEYS = (
+    "FRONTEND_DEPLOY_URL",  # Railway deploy script sets this
+    "RAILWAY_PUBLIC_DOMAIN",  # Railway auto-generated domain
+    "REFLEX_DEPLOY_URL",  # Legacy fallback
+    "DEPLOY_URL",  # Legacy fallback
 )
-# Ensure FRONTEND_URL starts with http or https
-if FRONTEND_URL and not FRONTEND_URL.startswith("http"):
-    FRONTEND_URL = f"https://{FRONTEND_URL}"
+
+
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Immutable application settings resolved from a single environment snapshot."""
+    # App configuration
+    APP_DISPLAY_NAME: str
+    REFLEX_APP_NAME: str
+    REFLEX_ENV_MODE: str
+    LOG_LEVEL: str
+    BACKEND_HOST: str
+
+    # Admin configuration
+    ADMIN_USER_EMAILS: FrozenSet[str]
+
+    # Clerk configuration
+    CLERK_PUBLISHABLE_KEY: Optional[str]
+    CLERK_SECRET_KEY: Optional[str]
+    CLERK_AUTHORIZED_DOMAINS: FrozenSet[str]
+
+    # Database configuration
+    DB_PASSWORD: Optional[str]
+    DB_CONN_URI: str
+    DB_LOCAL_URI: str
+    DATABASE_URL: str
+
+    # API / frontend URLs
+    API_URL: str
+    FRONTEND_DEPLOY_URL: Optional[str]
+    RAILWAY_PUBLIC_DOMAIN: Optional[str]
+    FRONTEND_URL: str
+
+    @classmethod
+    def from_env(cls, env: Mapping[str, str]) -> "Config":
+        """Build the settings from a single environment mapping."""
+        _env = env.get
+        reflex_env_mode = _env("APP_ENV", "DEV").upper()
+        log_level = _env("LOG_LEVEL", "DEBUG" if reflex_env_mode in _DEV_MODES else "INFO").upper()
+
+        clerk_authorized_domains = frozenset(filter(None, [
+            *_env("CLERK_AUTHORIZED_DOMAINS", "localhost:3000,*").split(","),
+            _env("FRONTEND_URL", ""),  # add railway frontend domain if needed
+        ]))
+
+        db_password = _env("DB_PASSWORD")
+        reflex_db_url = _env("REFLEX_DB_URL")
+        db_conn_uri = (reflex_db_url or "").format(DB_PASSWORD=db_password) if db_password else (reflex_db_url or "")
+        db_local_uri = reflex_db_url if reflex_db_url is not None else "sqlite:///app.db"
+
+        # Frontend URL - prioritize FRONTEND_DEPLOY_URL for backend services
+        frontend_url = next(
+            (value for key in _FRONTEND_URL_KEYS if (value := _env(key))),
+            "http://localhost:3000",  # Development default
+        )
+        # Ensure FRONTEND_URL starts with http or https
+        if not frontend_url.startswith(("http://", "https://")):
+            frontend_url = f"https://{frontend_url}"
+
+        return cls(
+            APP_DISPLAY_NAME=_env("REFLEX_APP_NAME", "App Portal"),
+            REFLEX_APP_NAME=_env("REFLEX_APP_NAME", "app"),
+            REFLEX_ENV_MODE=reflex_env_mode,
+            LOG_LEVEL=log_level,
+            BACKEND_HOST=_env("BACKEND_HOST", "0.0.0.0"),
+            ADMIN_USER_EMAILS=frozenset(filter(None, _env("ADMIN_USER_EMAILS", "").split(","))),
+            CLERK_PUBLISHABLE_KEY=_env("CLERK_PUBLISHABLE_KEY"),
+            CLERK_SECRET_KEY=_env("CLERK_SECRET_KEY"),
+            CLERK_AUTHORIZED_DOMAINS=clerk_authorized_domains,
+            DB_PASSWORD=db_password,
+            DB_CONN_URI=db_conn_uri,
+            DB_LOCAL_URI=db_local_uri,
+            # if REFLEX_DB_URL not specified, use local database in development. Otherwise, stick to REFLEX_DB_URL
+            DATABASE_URL=db_local_uri if reflex_env_mode == "DEV" else db_conn_uri,
+            API_URL=_env("REFLEX_API_URL", _env("API_URL", "http://localhost:8000")),
+            FRONTEND_DEPLOY_URL=_env("FRONTEND_DEPLOY_URL"),
+            RAILWAY_PUBLIC_DOMAIN=_env("RAILWAY_PUBLIC_DOMAIN"),
+            FRONTEND_URL=frontend_url,
+        )
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the application settings, resolved on first use and shared afterwards."""
+    config = Config.from_env(_ENV)
+    if config.LOG_LEVEL == "DEBUG":
+        sys.stderr.write(f"App environment: {config.REFLEX_ENV_MODE}\n")
+    return config
+
 
 # Admin Config table name registered in models/ at MODEL_FACTORY
 ADMIN_CONFIG_TABLE_NAME = "admin_config"
-ADMIN_CONFIG_TABLE_JSON_CONFIG_COL = "configuration"
\ No newline at end of file
+ADMIN_CONFIG_TABLE_JSON_CONFIG_COL = "configuration"
+
+
+def __getattr__(name: str):
+    """Expose the settings as module attributes, e.g. `CONFIG.FRONTEND_URL`."""
+    try:
+        return getattr(get_config(), name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
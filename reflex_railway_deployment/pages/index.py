@@ -1,16 +1,70 @@
+from functools import lru_cache
+
 import reflex as rx
 from ..state import State, BioAllowableActionTypes
-from typing import Any, Callable, List
+from typing import Any, Callable, List, Tuple
+
+# Action type options for the annotation form, built once at import
+_BIO_ACTION_CHOICES = tuple(BioAllowableActionTypes._member_names_)
+
+# Shared style props, built once and passed by reference to the component helpers
+_LABEL_KW = dict(
+    font_weight="500",
+    font_size="0.875rem",
+    color="var(--text-color)",
+    margin_bottom="0.5rem",
+)
+_BUTTON_HOVER = {
+    "background_color": "var(--button-hover-bg)",
+    "transform": "translateY(-1px)",
+}
+_ICON_BUTTON_HOVER = {"background": "var(--button-hover-bg)"}
+_INPUT_HOVER = {"border_color": "var(--border-hover-color)"}
+_INPUT_FOCUS = {"border_color": "var(--border-focus-color)"}
+_INPUT_KW = dict(
+    border_color="var(--border-color)",
+    background_color="var(--input-bg)",
+    color="var(--text-color)",
+    _hover=_INPUT_HOVER,
+    _focus=_INPUT_FOCUS,
+)
+_LABEL_TEXT_KW = dict(font_weight="500", min_width="150px")
+_LABELED_ROW_KW = dict(width="100%", spacing="4")
+_LABELED_TEXTAREA_ROW_KW = dict(_LABELED_ROW_KW, align_items="flex-start")
+_MESSAGE_BOX_KW = dict(
+    padding="0.5rem",
+    border="1px solid",
+    border_radius="md",
+    margin_top="0.5rem",
+)
+
+# Page-level CSS variables (light theme, with dark-mode overrides)
+_PAGE_STYLE = {
+    "--main-bg": "hsl(0, 0%, 98%)",
+    "--card-bg": "hsl(0, 0%, 100%)",
+    "--text-color": "hsl(0, 0%, 20%)",
+    "--border-color": "hsl(0, 0%, 85%)",
+    "--border-hover-color": "hsl(0, 0%, 70%)",
+    "--border-focus-color": "hsl(215, 100%, 50%)",
+    "--button-bg": "hsl(215, 100%, 50%)",
+    "--button-hover-bg": "hsl(215, 100%, 45%)",
+    "--input-bg": "hsl(0, 0%, 100%)",
+    "@media (prefers-color-scheme: dark)": {
+        "--main-bg": "hsl(0, 0%, 10%)",
+        "--card-bg": "hsl(0, 0%, 15%)",
+        "--text-color": "hsl(0, 0%, 90%)",
+        "--border-color": "hsl(0, 0%, 30%)",
+        "--border-hover-color": "hsl(0, 0%, 40%)",
+        "--border-focus-color": "hsl(215, 100%, 60%)",
+        "--button-bg": "hsl(215, 100%, 50%)",
+        "--button-hover-bg": "hsl(215, 100%, 55%)",
+        "--input-bg": "hsl(0, 0%, 20%)",
+    },
+}
 
 def create_label(text: str) -> rx.Component:
     """Create a label with specific styling."""
-    return rx.text(
-        text,
-        font_weight="500",
-        font_size="0.875rem",
-        color="var(--text-color)",
-        margin_bottom="0.5rem",
-    )
+    return rx.text(text, **_LABEL_KW)
 
 def create_button(text, on_click, color_scheme="primary"):
     """Create a button with specific styling."""
@@ -21,10 +75,7 @@ def create_button(text, on_click, color_scheme="primary"):
         border_radius="md",
         color="var(--text-color)",
         background_color="var(--button-bg)",
-        _hover={
-            "background_color": "var(--button-hover-bg)",
-            "transform": "translateY(-1px)",
-        },
+        _hover=_BUTTON_HOVER,
         transition="all 0.2s",
     )
 
@@ -34,11 +85,7 @@ def create_input_field(placeholder: str, value: Any, on_change: Any, **kwargs) -
         placeholder=placeholder,
         value=value,
         on_change=on_change,
-        border_color="var(--border-color)",
-        background_color="var(--input-bg)",
-        color="var(--text-color)",
-        _hover={"border_color": "var(--border-hover-color)"},
-        _focus={"border_color": "var(--border-focus-color)"},
+        **_INPUT_KW,
         **kwargs,
     )
 
@@ -49,11 +96,7 @@ def create_textarea(placeholder, value, on_change):
         value=value,
         on_change=on_change,
         display="block",
-        border_color="var(--border-color)",
-        background_color="var(--input-bg)",
-        color="var(--text-color)",
-        _hover={"border_color": "var(--border-hover-color)"},
-        _focus={"border_color": "var(--border-focus-color)"},
+        **_INPUT_KW,
         margin_top="0.25rem",
         border_radius="0.375rem",
         box_shadow="0 1px 2px 0 rgba(0, 0, 0, 0.05)",
@@ -61,71 +104,54 @@ def create_textarea(placeholder, value, on_change):
         min_height="100px",
     )
 
-def create_labeled_input(label_text: str, placeholder: str, value: str, on_change: Callable) -> rx.Component:
-    """Create a box containing a label and an input field in a row."""
-    return rx.hstack(
-        rx.text(label_text, font_weight="500", min_width="150px"),
-        rx.input(
-            placeholder=placeholder,
-            value=value,
-            on_change=on_change,
-            flex="1",
-        ),
-        width="100%",
-        spacing="4",
-    )
+def create_labeled_field(
+    control: Callable[..., rx.Component],
+    label_text: str,
+    placeholder: str,
+    value: str,
+    on_change: Callable,
+    align_top: bool = False,
+    **kwargs,
+) -> rx.Component:
+    """Create a row containing a label and a form control such as `rx.input` or `rx.text_area`.
 
-def create_labeled_textarea(label_text: str, placeholder: str, value: str, on_change: Callable) -> rx.Component:
-    """Create a box containing a label and a textarea in a row."""
+    Set `align_top` for multi-line controls so the label lines up with their first line;
+    extra keyword arguments are passed to the control.
+    """
     return rx.hstack(
-        rx.text(label_text, font_weight="500", min_width="150px"),
-        rx.text_area(
+        rx.text(label_text, **_LABEL_TEXT_KW),
+        control(
             placeholder=placeholder,
             value=value,
             on_change=on_change,
             flex="1",
-            min_height="100px",
+            **kwargs,
         ),
-        width="100%",
-        spacing="4",
-        align_items="flex-start",
+        **(_LABELED_TEXTAREA_ROW_KW if align_top else _LABELED_ROW_KW),
     )
 
-def create_error_message(error_text: str) -> rx.Component:
-    """Create an error message component."""
-    return rx.cond(
-        error_text != "",
-        rx.box(
-            rx.text(
-                error_text,
-                color="red.500",
-                font_size="0.875rem",
-            ),
-            padding="0.5rem",
-            border="1px solid",
-            border_color="red.200",
-            border_radius="md",
-            background_color="red.50",
-            margin_top="0.5rem",
-        ),
-    )
+@lru_cache(maxsize=16)
+def _message_colors(variant: str) -> Tuple[str, str, str]:
+    """(text, border, background) colors for a message box of the given color scheme (e.g. "red")."""
+    return f"{variant}.500", f"{variant}.200", f"{variant}.50"
 
-def create_success_message(success_text: str) -> rx.Component:
-    """Create a success message component."""
+def create_message(text: str, variant: str) -> rx.Component:
+    """Create a message box, shown only when `text` is non-empty.
+
+    `variant` is the color scheme: "red" for errors, "green" for success, "blue" for progress.
+    """
+    color, border_color, background_color = _message_colors(variant)
     return rx.cond(
-        success_text != "",
+        text != "",
         rx.box(
             rx.text(
-                success_text,
-                color="green.500",
+                text,
+                color=color,
                 font_size="0.875rem",
             ),
-            padding="0.5rem",
-            border="1px solid",
-            border_color="green.200",
-            border_radius="md",
-            background_color="green.50",
-            margin_top="0.5rem",
+            border_color=border_color,
+            background_color=background_color,
+            **_MESSAGE_BOX_KW,
         ),
     )
 
@@ -139,7 +165,7 @@ def create_video_player():
             controls=True,
             on_progress=State.update_progress,
         ),
-        create_error_message(State.video_error),
+        create_message(State.video_error, "red"),
         rx.hstack(
             rx.text(f"Current Frame: {State.current_frame} (at {State.current_time:.2f} seconds)", color="var(--text-color)"),
             rx.hstack(
@@ -151,11 +177,7 @@ def create_video_player():
                     min_=1,
                     max_=120,
                     width="100px",
-                    border_color="var(--border-color)",
-                    background_color="var(--input-bg)",
-                    color="var(--text-color)",
-                    _hover={"border_color": "var(--border-hover-color)"},
-                    _focus={"border_color": "var(--border-focus-color)"},
+                    **_INPUT_KW,
                 ),
             ),
             width="100%",
@@ -214,49 +236,59 @@ def create_annotation_form():
             ),
             rx.cond(
                 State.is_natural_language_mode,
-                create_labeled_textarea(
+                create_labeled_field(
+                    rx.text_area,
                     "Description",
                     "Enter natural language description...",
                     State.natural_language_description,
                     State.set_natural_language_description,
+                    align_top=True,
+                    min_height="100px",
                 ),
                 rx.vstack(
                     rx.select(
-                        BioAllowableActionTypes._member_names_,
+                        _BIO_ACTION_CHOICES,
                         placeholder="Select action type",
                         value=State.action_type,
                         on_change=State.set_action_type,
                         color_scheme="blue",
                     ),
-                    create_labeled_input(
+                    create_labeled_field(
+                        rx.input,
                         "Description",
                         "Enter action description",
                         State.action_description,
                         State.set_action_description,
                     ),
-                    create_labeled_input(
+                    create_labeled_field(
+                        rx.input,
                         "Apparatus",
                         "Enter detected apparatus (comma-separated)",
                         State.detected_apparatus,
                         State.set_detected_apparatus,
                     ),
-                    create_labeled_input(
+                    create_labeled_field(
+                        rx.input,
                         "Instruments",
                         "Enter detected instruments (comma-separated)",
                         State.detected_instruments,
                         State.set_detected_instruments,
                     ),
-                    create_labeled_input(
+                    create_labeled_field(
+                        rx.input,
                         "Materials",
                         "Enter detected materials (comma-separated)",
                         State.detected_materials,
                         State.set_detected_materials,
                     ),
-                    create_labeled_textarea(
+                    create_labeled_field(
+                        rx.text_area,
                         "Spatial Info",
                         "Enter spatial information as JSON",
                         State.spatial_information,
                         State.set_spatial_information,
+                        align_top=True,
+                        min_height="100px",
                     ),
                     width="100%",
                     spacing="4",
@@ -316,26 +348,11 @@ def create_huggingface_section():
                 color_scheme="green",
             ),
             # Progress section
-            rx.cond(
-                State.hf_progress != "",
-                rx.box(
-                    rx.text(
-                        State.hf_progress,
-                        color="blue.500",
-                        font_size="0.875rem",
-                    ),
-                    padding="0.5rem",
-                    border="1px solid",
-                    border_color="blue.200",
-                    border_radius="md",
-                    background_color="blue.50",
-                    margin_top="0.5rem",
-                ),
-            ),
+            create_message(State.hf_progress, "blue"),
             # Error message
-            create_error_message(State.hf_error),
+            create_message(State.hf_error, "red"),
             # Success message
-            create_success_message(State.hf_success),
+            create_message(State.hf_success, "green"),
             spacing="4",
             align_items="flex-start",
             width="100%",
@@ -391,33 +408,12 @@ def index():
             on_click=rx.toggle_color_mode,
             float="right",
             background="transparent",
-            _hover={"background": "var(--button-hover-bg)"},
+            _hover=_ICON_BUTTON_HOVER,
         ),
         create_main_content(),
         padding="2rem",
         min_height="100vh",
         background="var(--main-bg)",
         color_scheme="auto",
-        style={
-            "--main-bg": "hsl(0, 0%, 98%)",
-            "--card-bg": "hsl(0, 0%, 100%)",
-            "--text-color": "hsl(0, 0%, 20%)",
-            "--border-color": "hsl(0, 0%, 85%)",
-            "--border-hover-color": "hsl(0, 0%, 70%)",
-            "--border-focus-color": "hsl(215, 100%, 50%)",
-            "--button-bg": "hsl(215, 100%, 50%)",
-            "--button-hover-bg": "hsl(215, 100%, 45%)",
-            "--input-bg": "hsl(0, 0%, 100%)",
-            "@media (prefers-color-scheme: dark)": {
-                "--main-bg": "hsl(0, 0%, 10%)",
-                "--card-bg": "hsl(0, 0%, 15%)",
-                "--text-color": "hsl(0, 0%, 90%)",
-                "--border-color": "hsl(0, 0%, 30%)",
-                "--border-hover-color": "hsl(0, 0%, 40%)",
-                "--border-focus-color": "hsl(215, 100%, 60%)",
-                "--button-bg": "hsl(215, 100%, 50%)",
-                "--button-hover-bg": "hsl(215, 100%, 55%)",
-                "--input-bg": "hsl(0, 0%, 20%)",
-            }
-        },
+        style=_PAGE_STYLE,
     )
\ No newline at end of file
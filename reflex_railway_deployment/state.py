@@ -2,25 +2,52 @@ from typing import List, Dict, Any, Optional, Tuple
 import os
 import json
 from datetime import datetime
-from langchain.output_parsers import PydanticOutputParser
-from langchain.prompts import PromptTemplate
-from langchain_openai import ChatOpenAI
+from functools import lru_cache
+from urllib.parse import urlparse
 
 import reflex as rx
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Importing config loads environment variables (.env) once for the whole app
+from . import config  # noqa: F401  (loads .env)
 
-from huggingface_hub import HfApi, CommitOperationAdd
-from huggingface_hub.utils import RepositoryNotFoundError
-import tempfile
+# LLM/Hugging Face clients (langchain, langchain_openai, huggingface_hub) are
+# heavy to import; import them inside the handlers that use them instead.
 
 # Import from app/models
 import sys
 from _PATH import EXTRA_PATHS
 sys.path.extend(EXTRA_PATHS)
-from models.llm.action_steps import ImageActionFrame, BioAllowableActionTypes
+from models.llm.action_steps import BioAllowableActionTypes
+
+# Common video file extensions, matched against the URL path (query/fragment excluded)
+_VIDEO_EXTS = (".mp4", ".webm", ".ogg", ".mov")
+
+
+@lru_cache(maxsize=128)
+def _check_video_url(url: str) -> str:
+    """Return the validation error for a video URL, or "" if it is valid.
+
+    Memoized so repeated edits/pastes of the same URL skip re-parsing.
+    """
+    try:
+        if not url:
+            return "Please enter a video URL"
+
+        # Check URL format (urlparse silently drops tabs/newlines, so reject those explicitly)
+        result = urlparse(url)
+        if not all([result.scheme, result.netloc]) or any(c in url for c in "\t\r\n"):
+            return "Invalid URL format"
+
+        # Check if URL ends with common video extensions
+        if not result.path.lower().endswith(_VIDEO_EXTS):
+            return "URL must point to a video file (mp4, webm, ogg, mov)"
+
+        # TODO: Add actual video file accessibility check if needed
+        return ""
+
+    except Exception as e:
+        return f"Error validating URL: {str(e)}"
+
 
 class State(rx.State):
     """The app state."""
@@ -29,36 +56,20 @@ class State(rx.State):
     video_error: str = ""
     current_time: float = 0
     fps: int = 60  # default fps
+    current_frame: int = 0  # kept in sync with current_time * fps
 
     def validate_video_url(self, url: str) -> bool:
         """Validate video URL format and accessibility."""
-        try:
-            if not url:
-                self.video_error = "Please enter a video URL"
-                return False
-                
-            # Check URL format
-            from urllib.parse import urlparse
-            result = urlparse(url)
-            if not all([result.scheme, result.netloc]):
-                self.video_error = "Invalid URL format"
-                return False
-            
-            # Check if URL ends with common video extensions
-            video_extensions = ['.mp4', '.webm', '.ogg', '.mov']
-            if not any(url.lower().endswith(ext) for ext in video_extensions):
-                self.video_error = "URL must point to a video file (mp4, webm, ogg, mov)"
-                return False
-            
-            # TODO: Add actual video file accessibility check if needed
-            return True
-            
-        except Exception as e:
-            self.video_error = f"Error validating URL: {str(e)}"
+        error = _check_video_url(url)
+        if error:
+            self.video_error = error
             return False
+        return True
     
     def set_video_url(self, url: str):
         """Set the video URL with validation."""
+        if url and url == self.video_url and not self.video_error:
+            return  # Already validated and set, nothing to clear
         self.video_error = ""  # Clear previous errors
         if self.validate_video_url(url):
             self.video_url = url
@@ -66,25 +77,25 @@ class State(rx.State):
             self.video_url = ""  # Clear invalid URL
     
     def update_progress(self, progress: dict):
-        """Update the current time from progress data."""
+        """Update the current time and frame from progress data."""
         try:
-            self.current_time = progress["playedSeconds"]
+            played_seconds = progress["playedSeconds"]
+            self.current_time = played_seconds
+            self.current_frame = int(played_seconds * self.fps)
         except (KeyError, TypeError) as e:
             self.video_error = f"Error updating video progress: {str(e)}"
     
     def set_fps(self, value: str):
         """Set the FPS value with validation."""
+        if value == str(self.fps) and not self.video_error:
+            return  # Unchanged and nothing to clear
         try:
             fps = int(value)
             if fps <= 0:
                 self.video_error = "FPS must be greater than 0"
             else:
                 self.fps = fps
+                self.current_frame = int(self.current_time * fps)
                 self.video_error = ""
         except ValueError:
-            self.video_error = "FPS must be a valid number"
-
-    @rx.var
-    def current_frame(self) -> int:
-        """Calculate current frame from time."""
-        return int(self.current_time * self.fps)
\ No newline at end of file
+            self.video_error = "FPS must be a valid number"
\ No newline at end of file
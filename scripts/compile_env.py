@@ -0,0 +1,86 @@
+"""Compile the project's .env file into an importable Python module.
+
+Usage:
+    python scripts/compile_env.py [path/to/.env] [--package PACKAGE_DIR]
+
+Writes `<package>/_env_compiled.py` containing an `ENV` dict literal, next to
+the package's `config.py`. `config.py` imports it instead of re-parsing .env on
+every start, so the values are loaded straight from CPython's .pyc cache.
+When .env is newer than the compiled module, `config.py` ignores the module
+and falls back to `load_dotenv()` until this script is re-run.
+
+Values are stored raw. A .env that uses `${VAR}` expansion is not compiled
+(and any existing module is removed), because `load_dotenv()` expands those at
+startup against the live environment.
+
+`--package` defaults to the single top-level directory containing a
+`config.py` (e.g. `app/` or `reflex_railway_deployment/`).
+"""
+import argparse
+import sys
+from pathlib import Path
+
+from dotenv import dotenv_values
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_NAME = "_env_compiled.py"
+
+
+def find_config_package(root: Path = ROOT) -> Path:
+    """Return the top-level package directory holding config.py."""
+    candidates = sorted(path.parent for path in root.glob("*/config.py"))
+    if len(candidates) != 1:
+        found = ", ".join(str(path.relative_to(root)) for path in candidates) or "none"
+        sys.exit(f"Cannot infer the config package (found: {found}); pass --package")
+    return candidates[0]
+
+
+def compile_env(env_path: Path, output: Path) -> int:
+    """Write the key/value pairs of `env_path` to `output`. Returns the number of keys.
+
+    Raises ValueError if any value uses `${VAR}` expansion: load_dotenv() resolves
+    those against the live environment at startup, which a compiled literal cannot.
+    """
+    values = {
+        key: value
+        for key, value in dotenv_values(env_path, interpolate=False).items()
+        if value is not None
+    }
+    interpolated = sorted(key for key, value in values.items() if "$" in value)
+    if interpolated:
+        raise ValueError(f"variables using ${{...}} expansion: {', '.join(interpolated)}")
+    lines = [
+        f'"""Generated from {env_path.name} by scripts/compile_env.py - do not edit."""',
+        "",
+        "# .env this module was compiled from; config.py ignores ENV when it is newer",
+        f"SOURCE = {str(env_path.resolve())!r}",
+        "",
+        "ENV: dict[str, str] = {",
+        *(f"    {key!r}: {value!r}," for key, value in values.items()),
+        "}",
+        "",
+    ]
+    output.write_text("\n".join(lines))
+    return len(values)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile .env into <package>/_env_compiled.py")
+    parser.add_argument("env_file", nargs="?", type=Path, default=ROOT / ".env", help="path to the .env file")
+    parser.add_argument("--package", type=Path, help="package directory containing config.py")
+    args = parser.parse_args()
+
+    if not args.env_file.is_file():
+        sys.exit(f"No .env file found at {args.env_file}")
+    package = args.package or find_config_package()
+    if not (package / "config.py").is_file():
+        sys.exit(f"No config.py found in {package}")
+
+    output = package / OUTPUT_NAME
+    try:
+        count = compile_env(args.env_file, output)
+    except ValueError as e:
+        # Remove any previous module so config.py falls back to load_dotenv()
+        output.unlink(missing_ok=True)
+        sys.exit(f"Not compiling {args.env_file} ({e}); config.py will use load_dotenv() instead")
+    print(f"Compiled {count} variables from {args.env_file} into {output}")